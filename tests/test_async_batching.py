@@ -0,0 +1,109 @@
+"""
+Tests for AsyncWeatherApp's windowed Group endpoint batching
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather_app
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class AsyncBatchingTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Serve a fake Group endpoint on a local port
+        """
+        self.group_calls = []
+        self.group_body = None  # Replaces the normal reply when set
+
+        async def group(request):
+            city_ids = request.query["id"].split(",")
+            self.group_calls.append(city_ids)
+            if self.group_body is not None:
+                return web.json_response(self.group_body)
+            entries = [{"id": int(city_id), "name": f"City {city_id}"} for city_id in city_ids]
+            return web.json_response({"cnt": len(entries), "list": entries})
+
+        app = web.Application()
+        app.router.add_get("/data/2.5/group", group)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self.runner.addresses[0][:2]
+
+        self.app = weather_app.AsyncWeatherApp("test-key")
+        self.app.host = f"http://{host}:{port}"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_full_batch_flushes_without_waiting_for_window(self):
+        async with self.app:
+            results = await asyncio.wait_for(
+                asyncio.gather(*(self.app.get_batched(i) for i in range(1, 26))),
+                timeout=1
+            )
+
+        self.assertEqual([len(call) for call in self.group_calls], [20, 5])
+        self.assertEqual([weather_data["id"] for weather_data in results], list(range(1, 26)))
+        self.assertTrue(all(weather_data["cod"] == 200 for weather_data in results))
+
+    async def test_lookups_within_window_share_one_call(self):
+        async def late_lookup():
+            await asyncio.sleep(weather_app.BATCH_WINDOW_SECONDS / 4)
+            return await self.app.get_batched(7)
+
+        async with self.app:
+            first, second = await asyncio.gather(self.app.get_batched(5), late_lookup())
+
+        self.assertEqual(self.group_calls, [["5", "7"]])
+        self.assertEqual((first["name"], second["name"]), ("City 5", "City 7"))
+
+    async def test_exit_cancels_lookups_still_in_window(self):
+        async with self.app:
+            lookup = asyncio.create_task(self.app.get_batched(1))
+            await asyncio.sleep(0)  # Let the lookup join the open window
+
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(lookup, timeout=1)
+        self.assertEqual(self.group_calls, [])
+
+    async def test_unexpected_body_resolves_every_lookup(self):
+        self.group_body = [{"id": 1}]
+
+        async with self.app:
+            results = await asyncio.wait_for(
+                asyncio.gather(self.app.get_batched(1), self.app.get_batched(2)),
+                timeout=1
+            )
+
+        self.assertEqual(results, [None, None])
+
+    async def test_unexpected_error_reaches_every_lookup(self):
+        async with self.app:
+            with mock.patch.object(weather_app, "json_loads", side_effect=RuntimeError("boom")):
+                lookups = asyncio.gather(self.app.get_batched(1), self.app.get_batched(2),
+                                         return_exceptions=True)
+                results = await asyncio.wait_for(lookups, timeout=1)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_get_batched_requires_open_context(self):
+        with self.assertRaises(RuntimeError):
+            await self.app.get_batched(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests for AsyncWeatherApp's coalescing of identical in-flight lookups
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather_app
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class AsyncCoalescingTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Serve a slow fake weather endpoint on a local port
+        """
+        self.weather_calls = []
+
+        async def weather(request):
+            self.weather_calls.append(request.query["q"])
+            await asyncio.sleep(0.1)
+            return web.json_response({"cod": 200, "name": request.query["q"]})
+
+        app = web.Application()
+        app.router.add_get("/data/2.5/weather", weather)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self.runner.addresses[0][:2]
+
+        self.app = weather_app.AsyncWeatherApp("test-key")
+        self.app.host = f"http://{host}:{port}"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_duplicate_cities_share_one_request(self):
+        async with self.app:
+            results = await self.app.get_many(["London", "Paris", " london", "LONDON", "Paris"])
+
+        self.assertEqual(sorted(self.weather_calls), ["London", "Paris"])
+        self.assertEqual([weather_data["name"] for weather_data in results],
+                         ["London", "Paris", "London", "London", "Paris"])
+
+    async def test_cancelled_first_caller_does_not_cancel_waiters(self):
+        async with self.app:
+            first = asyncio.create_task(self.app.get_weather_by_city("Paris"))
+            await asyncio.sleep(0)  # Let the first caller start the fetch
+            second = asyncio.create_task(self.app.get_weather_by_city("Paris"))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            weather_data = await asyncio.wait_for(second, timeout=1)
+
+        self.assertTrue(first.cancelled())
+        self.assertEqual(weather_data["name"], "Paris")
+        self.assertEqual(self.weather_calls, ["Paris"])
+
+    async def test_finished_lookup_is_not_reused(self):
+        async with self.app:
+            await self.app.get_weather_by_city("Paris")
+            await self.app.get_weather_by_city("Paris")
+
+        self.assertEqual(self.weather_calls, ["Paris", "Paris"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Tests for WeatherApp's HTTP session and cache behaviour
+"""
+
+import dbm
+import json
+import os
+import shelve
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+from urllib3.response import HTTPResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather_app
+
+
+class CappedRetryTest(unittest.TestCase):
+    def test_retry_after_is_honoured_up_to_the_cap(self):
+        retry = weather_app.CappedRetry(total=3, respect_retry_after_header=True)
+
+        short = HTTPResponse(status=429, headers={"Retry-After": "2"})
+        long = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+
+        self.assertEqual(retry.get_retry_after(short), 2)
+        self.assertEqual(retry.get_retry_after(long), weather_app.RETRY_AFTER_MAX_SECONDS)
+
+    def test_rate_limits_are_retried_without_raising(self):
+        app = weather_app.WeatherApp("test-key", cache_path=None)
+        retry = app.session.get_adapter("http://").max_retries
+        app.close()
+
+        self.assertIsInstance(retry, weather_app.CappedRetry)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertTrue(retry.respect_retry_after_header)
+        self.assertFalse(retry.raise_on_status)
+
+
+class ScriptedHandler(BaseHTTPRequestHandler):
+    """
+    Answer each GET with the next (status, headers, body) from the server's script
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        status, headers, body = self.server.script.pop(0)
+        body = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ConditionalGetTest(unittest.TestCase):
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), ScriptedHandler)
+        self.server.script = []
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.app = weather_app.WeatherApp("test-key", cache_path=None)
+        self.app.base_url = f"http://127.0.0.1:{self.server.server_port}/data/2.5/weather"
+
+        # Every cached entry is immediately stale, so each lookup revalidates
+        patcher = mock.patch.object(weather_app, "CACHE_TTL_SECONDS", -1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.app.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def cached_validators(self):
+        return self.app._cache[("metric", "city", "london")][2:]
+
+    def test_not_modified_reuses_stored_payload(self):
+        payload = {"cod": 200, "name": "London"}
+        self.server.script = [
+            (200, {"ETag": '"v1"', "Last-Modified": "Mon"}, payload),
+            (304, {}, None),
+        ]
+
+        self.assertEqual(self.app.get_weather_by_city("London"), payload)
+        self.assertEqual(self.app.get_weather_by_city("London"), payload)
+
+        self.assertEqual(self.server.requests[1].get("If-None-Match"), '"v1"')
+        self.assertEqual(self.server.requests[1].get("If-Modified-Since"), "Mon")
+        self.assertEqual(self.cached_validators(), ('"v1"', "Mon"))
+
+    def test_full_response_replaces_validators(self):
+        self.server.script = [
+            (200, {"ETag": '"v1"'}, {"cod": 200, "name": "London"}),
+            (200, {}, {"cod": 200, "name": "London", "temp": 1}),
+            (200, {}, {"cod": 200, "name": "London", "temp": 2}),
+        ]
+
+        self.app.get_weather_by_city("London")
+        self.assertEqual(self.app.get_weather_by_city("London")["temp"], 1)
+        self.assertEqual(self.cached_validators(), (None, None))
+
+        self.app.get_weather_by_city("London")
+        self.assertNotIn("If-None-Match", self.server.requests[2])
+
+
+class DiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_path = os.path.join(tempfile.mkdtemp(), "weather_cache")
+
+    def open_app(self):
+        app = weather_app.WeatherApp("test-key", cache_path=self.cache_path)
+        app.session = mock.Mock()  # Any network access would be a cache miss
+        self.addCleanup(app.close)
+        return app
+
+    def test_relaunch_serves_fresh_entry_from_disk(self):
+        payload = {"cod": 200, "name": "London", "id": 2643743}
+        with shelve.open(self.cache_path) as disk:
+            disk["metric:city:london"] = {
+                "ts": time.time(), "payload": payload, "etag": '"v1"', "last_modified": None
+            }
+
+        app = self.open_app()
+
+        self.assertEqual(app.get_weather_by_city("London"), payload)
+        app.session.get.assert_not_called()
+
+    def test_unreadable_and_expired_entries_are_misses_and_pruned(self):
+        old = time.time() - weather_app.DISK_CACHE_MAX_AGE_SECONDS - 1
+        with shelve.open(self.cache_path) as disk:
+            disk["metric:city:london"] = {"ts": time.time(), "payload": None}
+            disk["metric:city:paris"] = "not an entry"
+            disk["metric:city:oslo"] = {"timestamp": time.time()}
+            disk["metric:city:rome"] = {"ts": old, "payload": {"cod": 200}}
+        with dbm.open(self.cache_path, "w") as disk:
+            disk[b"metric:city:lima"] = b"\x80\x04not a pickle"
+
+        app = self.open_app()
+        app.session.get.side_effect = weather_app.requests.exceptions.ConnectionError("offline")
+
+        self.assertEqual(len(app._disk), 0)
+        for city in ["London", "Paris", "Oslo", "Rome", "Lima"]:
+            self.assertIsNone(app.get_weather_by_city(city))
+
+    def test_close_unregisters_exit_hook(self):
+        app = weather_app.WeatherApp("test-key", cache_path=self.cache_path)
+
+        with mock.patch.object(weather_app.atexit, "unregister") as unregister:
+            app.close()
+            app.close()
+
+        unregister.assert_called_once_with(app.close)
+
+
+if __name__ == "__main__":
+    unittest.main()
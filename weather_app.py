@@ -3,19 +3,159 @@ Basic Weather App
 Fetches current weather data using OpenWeatherMap API
 """
 
+import asyncio
+import atexit
+import dbm
+import os
+import pickle
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
+import shelve
+from collections import OrderedDict
 from datetime import datetime
 import sys
+import time
+
+try:
+    import aiohttp
+except ImportError:  # Only needed for multi-city lookups
+    aiohttp = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Fall back to the standard library parser
+    json_loads = json.loads
+
+# OpenWeatherMap refreshes current weather roughly every 10 minutes
+CACHE_TTL_SECONDS = 600
+CACHE_MAX_SIZE = 128
+CACHE_PATH = os.path.expanduser("~/.weather_cache")
+
+# Disk entries this old are dropped: too stale to serve or usefully revalidate
+DISK_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Raised when a shelve entry was written by another format or is corrupt
+_UNREADABLE_ENTRY_ERRORS = (pickle.UnpicklingError, EOFError, ImportError, AttributeError) + dbm.error
+
+# The Group endpoint accepts at most 20 city IDs per request
+GROUP_MAX_SIZE = 20
+
+# Longest pause honoured from a Retry-After header, so the CLI stays responsive
+RETRY_AFTER_MAX_SECONDS = 5
+
+# How long async lookups wait for others to share a Group endpoint call
+BATCH_WINDOW_SECONDS = 0.2
+
+# Compass direction for every whole degree, built once at import time
+_DIRECTIONS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+COMPASS = tuple(_DIRECTIONS[round(deg / 45) % 8] for deg in range(360))
+
+# ZIP/postal codes: 5-10 digits with an optional "-NNNN" extension
+_ZIP_RE = re.compile(r'^\d{5,10}(?:-\d{0,4})?$')
+
+UNIT_SYMBOLS = {"metric": "°C", "imperial": "°F"}
+
+# Weather icon for each OpenWeatherMap "main" condition
+ICONS = {
+    "clear": "☀️",
+    "clouds": "☁️",
+    "rain": "🌧️",
+    "drizzle": "🌦️",
+    "thunderstorm": "⛈️",
+    "snow": "❄️",
+    "mist": "🌫️",
+    "smoke": "💨",
+    "haze": "😶‍🌫️",
+    "dust": "🌪️",
+    "fog": "🌁"
+}
+
+
+class CappedRetry(Retry):
+    """
+    Retry policy that honours Retry-After, up to RETRY_AFTER_MAX_SECONDS
+    """
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX_SECONDS)
+
+
+def _fmt_ts(ts):
+    """
+    Format a Unix timestamp as local HH:MM:SS
+    """
+    dt = datetime.fromtimestamp(ts)
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
 
 class WeatherApp:
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache_path=CACHE_PATH):
         """
-        Initialize the Weather App with API key
+        Initialize the Weather App with API key and an optional on-disk
+        cache location (None keeps the cache in memory only)
         """
         self.api_key = api_key
         self.base_url = "http://api.openweathermap.org/data/2.5/weather"
+        self.group_url = "http://api.openweathermap.org/data/2.5/group"
         self.units = "metric"  # Default to Celsius
+        self.timeout = 10  # Seconds to wait for the API
+        
+        # Reuse one session so repeated lookups share a keep-alive connection
+        self.session = requests.Session()
+        self.session.params = {"appid": api_key, "lang": "en"}
+        self.session.headers["Accept-Encoding"] = "gzip"
+        
+        # Retry transient server errors and rate limits on the pooled connection,
+        # returning the last response so callers still see its status
+        retry = CappedRetry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        self.session.mount("http://", adapter)
+        
+        # Recent responses keyed by (units, kind, location)
+        # -> (epoch timestamp, data, etag, last_modified)
+        self._cache = OrderedDict()
+        
+        # City IDs learned from earlier responses, for Group endpoint lookups
+        self._city_ids = {}
+        
+        # Persist the cache so a relaunch can reuse recent responses
+        self._disk = None
+        if cache_path:
+            try:
+                self._disk = shelve.open(cache_path)
+                atexit.register(self.close)
+            except dbm.error as e:
+                print(f"Weather cache unavailable, continuing without it: {e}")
+            else:
+                self._prune_disk()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """
+        Close the underlying HTTP session and on-disk cache
+        """
+        self.session.close()
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+            atexit.unregister(self.close)
         
     def get_weather_by_city(self, city_name):
         """
@@ -23,18 +163,10 @@ class WeatherApp:
         """
         params = {
             "q": city_name,
-            "appid": self.api_key,
-            "units": self.units,
-            "lang": "en"
+            "units": self.units
         }
-        
-        try:
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()  # Raise exception for bad status codes
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching weather data: {e}")
-            return None
+        key = (self.units, "city", city_name.strip().lower())
+        return self._fetch(key, params)
     
     def get_weather_by_zip(self, zip_code, country_code="US"):
         """
@@ -42,18 +174,194 @@ class WeatherApp:
         """
         params = {
             "zip": f"{zip_code},{country_code}",
-            "appid": self.api_key,
-            "units": self.units,
-            "lang": "en"
+            "units": self.units
         }
+        key = (self.units, "zip", zip_code.strip(), country_code.strip().upper())
+        return self._fetch(key, params)
+    
+    def _fetch(self, key, params):
+        """
+        Return cached weather data for key, or fetch it from the API
+        """
+        cached = self._cache_get(key)
+        if cached:
+            return cached
+        
+        # Revalidate an expired entry so the API can answer 304 without a body
+        headers = {}
+        etag = last_modified = None
+        stale = self._cache_entry(key)
+        if stale:
+            _, _, etag, last_modified = stale
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         
         try:
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            response = self.session.get(self.base_url, params=params, headers=headers,
+                                        timeout=self.timeout)
+            response.raise_for_status()  # Raise exception for bad status codes
+            if response.status_code == 304 and stale:
+                # A 304 may omit the validators, so keep the ones we already have
+                weather_data = stale[1]
+                etag = response.headers.get("ETag", etag)
+                last_modified = response.headers.get("Last-Modified", last_modified)
+            else:
+                weather_data = json_loads(response.content)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching weather data: {e}")
             return None
+        
+        self._cache_put(key, weather_data, etag, last_modified)
+        return weather_data
+    
+    def _cache_entry(self, key):
+        """
+        Return the cache entry for key from memory or disk, fresh or not
+        """
+        entry = self._cache.get(key)
+        if entry is None and self._disk is not None:
+            entry = self._read_disk_entry(":".join(key))
+            if entry:
+                self._remember(key, entry)
+        return entry
+    
+    def _read_disk_entry(self, disk_key):
+        """
+        Return a disk cache entry as a memory cache tuple, or None when it is
+        missing, unreadable or not shaped like an entry we wrote
+        """
+        try:
+            stored = self._disk.get(disk_key)
+        except _UNREADABLE_ENTRY_ERRORS:
+            return None
+        
+        if not isinstance(stored, dict):
+            return None
+        timestamp = stored.get("ts")
+        weather_data = stored.get("payload")
+        if not isinstance(timestamp, (int, float)) or not isinstance(weather_data, dict):
+            return None
+        return (timestamp, weather_data, stored.get("etag"), stored.get("last_modified"))
+    
+    def _prune_disk(self):
+        """
+        Drop disk cache entries that are unreadable or long past the TTL
+        """
+        cutoff = time.time() - DISK_CACHE_MAX_AGE_SECONDS
+        for disk_key in list(self._disk.keys()):
+            entry = self._read_disk_entry(disk_key)
+            if entry is None or entry[0] < cutoff:
+                del self._disk[disk_key]
+    
+    def _cache_get(self, key):
+        """
+        Return cached weather data for key if it is still fresh
+        """
+        cached = self._cache_entry(key)
+        if cached and time.time() - cached[0] < CACHE_TTL_SECONDS:
+            self._cache.move_to_end(key)
+            return cached[1]
+        return None
+    
+    def _cache_put(self, key, weather_data, etag=None, last_modified=None):
+        """
+        Store weather data in memory and write it through to disk
+        """
+        timestamp = time.time()
+        self._remember(key, (timestamp, weather_data, etag, last_modified))
+        
+        if self._disk is not None:
+            self._disk[":".join(key)] = {
+                "ts": timestamp,
+                "payload": weather_data,
+                "etag": etag,
+                "last_modified": last_modified
+            }
+    
+    def _remember(self, key, entry):
+        """
+        Keep a cache entry in memory, evicting the oldest entry when full
+        """
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+        
+        weather_data = entry[1]
+        if key[1] == "city" and "id" in weather_data:
+            self._city_ids[key[2]] = weather_data["id"]
+    
+    def get_weather_for_cities(self, city_ids):
+        """
+        Fetch weather data for several city IDs using the Group endpoint
+        """
+        results = []
+        for start in range(0, len(city_ids), GROUP_MAX_SIZE):
+            chunk = city_ids[start:start + GROUP_MAX_SIZE]
+            params = {
+                "id": ",".join(str(city_id) for city_id in chunk),
+                "units": self.units
+            }
+            
+            try:
+                response = self.session.get(self.group_url, params=params, timeout=self.timeout)
+                response.raise_for_status()
+                entries = json_loads(response.content).get("list", [])
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"Error fetching weather data: {e}")
+                continue
+            
+            # Group entries carry no status code of their own
+            for weather_data in entries:
+                weather_data.setdefault("cod", 200)
+            results.extend(entries)
+        return results
+    
+    def get_weather_for_city_names(self, cities, fetch_many=None):
+        """
+        Fetch weather data for several city names, batching known cities
+        into Group endpoint calls and using fetch_many for the rest.
+        fetch_many is expected to cache what it fetches, as _fetch() does.
+        """
+        if fetch_many is None:
+            fetch_many = lambda names: [self.get_weather_by_city(name) for name in names]
+        
+        keys = [(self.units, "city", city.strip().lower()) for city in cities]
+        results = [self._cache_get(key) for key in keys]
+        
+        known = [i for i, weather_data in enumerate(results)
+                 if not weather_data and keys[i][2] in self._city_ids]
+        if known:
+            city_ids = list(dict.fromkeys(self._city_ids[keys[i][2]] for i in known))
+            by_id = {weather_data.get("id"): weather_data
+                     for weather_data in self.get_weather_for_cities(city_ids)}
+            for i in known:
+                weather_data = by_id.get(self._city_ids[keys[i][2]])
+                if weather_data:
+                    # Keep the validators so a later refetch can still get a 304
+                    stale = self._cache_entry(keys[i])
+                    etag, last_modified = stale[2:] if stale else (None, None)
+                    self._cache_put(keys[i], weather_data, etag, last_modified)
+                    results[i] = weather_data
+        
+        missing = [i for i, weather_data in enumerate(results) if not weather_data]
+        if missing:
+            fetched = fetch_many([cities[i] for i in missing])
+            for i, weather_data in zip(missing, fetched):
+                results[i] = weather_data
+        return results
+    
+    def clear_cache(self):
+        """
+        Forget all cached weather data, in memory and on disk
+        """
+        self._cache.clear()
+        if self._disk is not None:
+            self._disk.clear()
     
     def set_units(self, units):
         """
@@ -96,18 +404,11 @@ class WeatherApp:
         sunset = weather_data.get("sys", {}).get("sunset")
         
         # Convert timestamps if available
-        if sunrise:
-            sunrise_time = datetime.fromtimestamp(sunrise).strftime('%H:%M:%S')
-        else:
-            sunrise_time = "N/A"
-            
-        if sunset:
-            sunset_time = datetime.fromtimestamp(sunset).strftime('%H:%M:%S')
-        else:
-            sunset_time = "N/A"
+        sunrise_time = _fmt_ts(sunrise) if sunrise else "N/A"
+        sunset_time = _fmt_ts(sunset) if sunset else "N/A"
         
         # Determine temperature unit symbol
-        unit_symbol = "°C" if self.units == "metric" else "°F"
+        unit_symbol = UNIT_SYMBOLS.get(self.units, "°F")
         
         # Display header
         print("\n" + "="*50)
@@ -123,9 +424,7 @@ class WeatherApp:
         
         if wind_dir != "N/A":
             # Convert wind direction degrees to compass direction
-            directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-            index = round(wind_dir / 45) % 8
-            wind_direction = directions[index]
+            wind_direction = COMPASS[round(wind_dir) % 360]
             print(f"🧭 Wind Direction: {wind_direction} ({wind_dir}°)")
         
         print(f"👁️  Visibility: {visibility} meters" if visibility != "N/A" else "👁️  Visibility: N/A")
@@ -139,21 +438,7 @@ class WeatherApp:
         
         # Weather icon based on description
         weather_main = weather_data.get("weather", [{}])[0].get("main", "").lower()
-        icons = {
-            "clear": "☀️",
-            "clouds": "☁️",
-            "rain": "🌧️",
-            "drizzle": "🌦️",
-            "thunderstorm": "⛈️",
-            "snow": "❄️",
-            "mist": "🌫️",
-            "smoke": "💨",
-            "haze": "😶‍🌫️",
-            "dust": "🌪️",
-            "fog": "🌁"
-        }
-        
-        icon = icons.get(weather_main, "🌈")
+        icon = ICONS.get(weather_main, "🌈")
         print(f"Weather Icon: {icon}")
         
         # Cloud coverage
@@ -166,15 +451,13 @@ class WeatherApp:
         """
         Validate user input for location
         """
-        if not input_str or input_str.isspace():
+        input_str = input_str.strip() if input_str else ""
+        if not input_str:
             return False, "Input cannot be empty."
         
-        # Check if input is a ZIP code (numbers only)
-        if input_str.replace("-", "").isdigit():
-            # Remove any hyphens from ZIP codes
-            clean_zip = input_str.replace("-", "")
-            if len(clean_zip) >= 5:
-                return True, "zip"
+        # Check if input is a ZIP code
+        if _ZIP_RE.match(input_str):
+            return True, "zip"
         
         # Otherwise treat as city name
         return True, "city"
@@ -196,19 +479,22 @@ class WeatherApp:
                 print("-"*30)
                 print("1. Check weather by location")
                 print("2. Change temperature units")
-                print("3. Exit")
+                print("3. Check multiple cities")
+                print("4. Exit")
                 
-                choice = input("\nEnter your choice (1-3): ").strip()
+                choice = input("\nEnter your choice (1-4): ").strip()
                 
                 if choice == "1":
                     self.check_weather()
                 elif choice == "2":
                     self.change_units()
                 elif choice == "3":
+                    self.check_multiple_cities()
+                elif choice == "4":
                     print("\nThank you for using the Weather App! Goodbye! 👋")
                     break
                 else:
-                    print("Invalid choice. Please enter 1, 2, or 3.")
+                    print("Invalid choice. Please enter 1, 2, 3, or 4.")
                     
             except KeyboardInterrupt:
                 print("\n\nProgram interrupted. Exiting...")
@@ -220,7 +506,11 @@ class WeatherApp:
         """
         Handle weather checking functionality
         """
-        location = input("\nEnter city name or ZIP code: ").strip()
+        location = input("\nEnter city name or ZIP code (separate several cities with ;): ").strip()
+        
+        if ";" in location:
+            self.check_multiple_cities(location)
+            return
         
         # Validate input
         is_valid, input_type = self.validate_input(location)
@@ -245,6 +535,60 @@ class WeatherApp:
         else:
             print("Could not retrieve weather data. Please check your input and try again.")
     
+    def check_multiple_cities(self, entry=None):
+        """
+        Handle checking several cities at once
+        """
+        if entry is None:
+            entry = input("\nEnter city names separated by semicolons (e.g., London; Paris, FR): ")
+        
+        cities = []
+        for location in entry.split(";"):
+            is_valid, input_type = self.validate_input(location)
+            if not is_valid:
+                continue
+            if input_type == "zip":
+                print(f"Skipping ZIP code {location.strip()}: look ZIP codes up one at a time.")
+                continue
+            cities.append(location.strip())
+        
+        if not cities:
+            print("Invalid input. Please try again.")
+            return
+        
+        # Cities we have not seen before are fetched concurrently when aiohttp is available
+        fetch_many = None
+        if aiohttp is not None:
+            fetch_many = self._get_many_concurrently
+        self.display_results(cities, self.get_weather_for_city_names(cities, fetch_many))
+    
+    def display_results(self, cities, results):
+        """
+        Display weather data for several cities
+        """
+        for city, weather_data in zip(cities, results):
+            if weather_data:
+                self.display_weather(weather_data)
+            else:
+                print(f"Could not retrieve weather data for {city}.")
+    
+    def _get_many_concurrently(self, cities):
+        """
+        Fetch several cities over aiohttp and cache the results
+        """
+        results = asyncio.run(self._get_many_async(cities))
+        for city, weather_data in zip(cities, results):
+            if weather_data:
+                self._cache_put((self.units, "city", city.strip().lower()), weather_data)
+        return results
+    
+    async def _get_many_async(self, cities):
+        """
+        Fetch weather data for several cities over one async session
+        """
+        async with AsyncWeatherApp(self.api_key, self.units) as async_app:
+            return await async_app.get_many(cities)
+    
     def change_units(self):
         """
         Allow user to change temperature units
@@ -267,6 +611,175 @@ class WeatherApp:
             print("Invalid choice. Keeping current units.")
 
 
+class AsyncWeatherApp:
+    def __init__(self, api_key, units="metric"):
+        """
+        Initialize the async Weather App with API key and units
+        """
+        self.api_key = api_key
+        self.host = "http://api.openweathermap.org"
+        self.path = "/data/2.5/weather"
+        self.group_path = "/data/2.5/group"
+        self.units = units
+        self.timeout = aiohttp.ClientTimeout(total=10)
+        self.session = None
+        
+        # Requests currently on the wire, so identical lookups share one call
+        self._inflight = {}
+        
+        # (city ID, future) pairs waiting to share one Group endpoint call.
+        # They stay here until the worker takes them, so shutdown can cancel
+        # every lookup that has not been dispatched.
+        self._pending = []
+        self._has_pending = None
+        self._batch_task = None
+        self._group_tasks = set()
+    
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(base_url=self.host, timeout=self.timeout)
+        self._has_pending = asyncio.Event()
+        self._batch_task = asyncio.create_task(self._batch_worker())
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._batch_task.cancel()
+        for task in self._inflight.values():
+            task.cancel()  # Only left running if all of its callers gave up
+        await asyncio.gather(self._batch_task, *self._group_tasks,
+                             *self._inflight.values(), return_exceptions=True)
+        
+        # Nothing will answer lookups that were never dispatched
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        
+        await self.session.close()
+    
+    async def get_weather_by_city(self, city_name):
+        """
+        Fetch weather data by city name without blocking the event loop
+        """
+        key = ("city", self.units, city_name.strip().lower())
+        task = self._inflight.get(key)
+        if task is None:
+            # The fetch runs in its own task so no single caller owns it
+            task = asyncio.create_task(self._fetch_city(city_name))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key, None))
+        
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def _fetch_city(self, city_name):
+        """
+        Request weather data for a city name from the API
+        """
+        params = {
+            "q": city_name,
+            "appid": self.api_key,
+            "units": self.units,
+            "lang": "en"
+        }
+        
+        try:
+            async with self.session.get(self.path, params=params) as response:
+                response.raise_for_status()
+                return json_loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Error fetching weather data for {city_name}: {e}")
+            return None
+    
+    async def get_batched(self, city_id):
+        """
+        Fetch weather data by city ID, sharing a Group endpoint call with
+        other lookups made within the same short window
+        """
+        if self._batch_task is None or self._batch_task.done():
+            raise RuntimeError("AsyncWeatherApp must be used as an async context manager")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((int(city_id), future))
+        self._has_pending.set()
+        return await future
+    
+    async def _batch_worker(self):
+        """
+        Collect queued city IDs and dispatch them in Group endpoint calls
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            # The window opens when the first lookup arrives
+            await self._has_pending.wait()
+            deadline = loop.time() + BATCH_WINDOW_SECONDS
+            
+            while len(self._pending) < GROUP_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._has_pending.clear()
+                try:
+                    await asyncio.wait_for(self._has_pending.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            
+            batch = self._pending[:GROUP_MAX_SIZE]
+            del self._pending[:GROUP_MAX_SIZE]
+            if self._pending:
+                self._has_pending.set()  # Leftovers open the next window
+            else:
+                self._has_pending.clear()
+            
+            # Send in the background so the next window can start collecting
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._group_tasks.add(task)
+            task.add_done_callback(self._group_tasks.discard)
+    
+    async def _dispatch_batch(self, batch):
+        """
+        Request one Group endpoint call and hand each entry to its waiter
+        """
+        city_ids = list(dict.fromkeys(city_id for city_id, _ in batch))
+        params = {
+            "id": ",".join(str(city_id) for city_id in city_ids),
+            "appid": self.api_key,
+            "units": self.units,
+            "lang": "en"
+        }
+        
+        by_id = {}
+        try:
+            async with self.session.get(self.group_path, params=params) as response:
+                response.raise_for_status()
+                body = json_loads(await response.read())
+            
+            entries = body.get("list") if isinstance(body, dict) else None
+            if not isinstance(entries, list):
+                raise ValueError("Unexpected Group response from the API")
+            
+            # Group entries carry no status code of their own
+            for weather_data in entries:
+                if isinstance(weather_data, dict):
+                    weather_data.setdefault("cod", 200)
+                    by_id[weather_data.get("id")] = weather_data
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"Error fetching weather data: {e}")
+        except Exception as e:
+            # Hand unexpected failures to the waiters instead of leaving them hanging
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for city_id, future in batch:
+                if not future.done():
+                    future.set_result(by_id.get(city_id))
+    
+    async def get_many(self, cities):
+        """
+        Fetch weather data for several cities concurrently
+        """
+        return await asyncio.gather(*(self.get_weather_by_city(city) for city in cities))
+
+
 def main():
     """
     Main function to run the weather app
@@ -274,19 +787,25 @@ def main():
     # ==== YOUR API KEY ====
     API_KEY = "YOUR_API_KEY_HERE"
     
+    # Create the app first so the key test warms up its session
+    app = WeatherApp(API_KEY)
+    
     # Test the API key
     print("🔐 Testing your OpenWeatherMap API key...")
     try:
-        test_url = f"http://api.openweathermap.org/data/2.5/weather?q=London&appid={API_KEY}"
-        response = requests.get(test_url, timeout=10)
+        # Only the status code matters, so stream and skip decoding the body
+        response = app.session.get(app.base_url, params={"q": "London"},
+                                   timeout=app.timeout, stream=True)
         
         if response.status_code == 200:
+            # Discard the body unread so the warm connection returns to the pool
+            response.raw.drain_conn()
+            response.close()
             print("✅ API key is VALID and working!")
             print("Starting Weather App...\n")
-            # Create and run the weather app
-            app = WeatherApp(API_KEY)
             app.run()
         elif response.status_code == 401:
+            response.close()
             print("❌ ERROR 401: Invalid API Key")
             print("\nDon't worry! This usually means:")
             print("1. Your key needs 10-15 minutes to activate (just wait)")
@@ -312,6 +831,8 @@ def main():
         print(f"❌ Error: {e}")
         print("\nTrying demo mode...")
         display_demo_weather()
+    finally:
+        app.close()
 
 
 def display_demo_weather():
@@ -344,4 +865,4 @@ if __name__ == "__main__":
         print("⚠️  This application is designed for Python 3.11.9 or higher.")
         print("   Some features might not work properly.")
     
-    main()
\ No newline at end of file
+    main()
\ No newline at end of file